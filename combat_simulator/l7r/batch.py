@@ -0,0 +1,24 @@
+import random
+from multiprocessing import Pool
+
+import l7r.combatant
+from l7r.engine import Engine
+
+
+def init_worker():
+    # forked workers inherit the parent's random state, so every worker
+    # would otherwise replay exactly the same fights
+    random.seed()
+    l7r.combatant.verbose = False
+
+
+def fight(formation_factory):
+    formation = formation_factory()
+    combatants = formation.combatants
+    Engine(formation)
+    return [(c.serious, c.dead) for c in combatants]
+
+
+def run_many(n, formation_factory, processes=None):
+    with Pool(processes, initializer=init_worker) as pool:
+        return pool.map(fight, [formation_factory] * n)
@@ -1,6 +1,6 @@
 import random
-from math import ceil
-from copy import deepcopy
+from copy import copy
+from functools import lru_cache
 from itertools import combinations
 from collections import defaultdict
 
@@ -8,11 +8,13 @@ from l7r.dice import d10, prob, xky, avg
 
 
 messages = []
+verbose = True
 
 
-def log(message):
-    messages.append(message)
-    print(messages[-1])
+def log(message, *args):
+    if verbose:
+        messages.append(message.format(*args))
+        print(messages[-1])
 
 
 def all_subsets(xs):
@@ -22,6 +24,12 @@ def all_subsets(xs):
     return all
 
 
+@lru_cache(maxsize=4096)
+def best_subset(bonuses, needed):
+    enough = [(sum(sub), sub) for sub in all_subsets(bonuses) if sum(sub) >= needed]
+    return min(enough)[1] if enough else ()
+
+
 class Combatant:
     counts = defaultdict(int)
 
@@ -91,6 +99,14 @@ class Combatant:
         del d['events']
         return d
 
+    def __copy__(self):
+        # next_damage consumes auto_once bonuses, so copies used for
+        # projections get their own; everything else is shared
+        c = self.__class__.__new__(self.__class__)
+        c.__dict__ = self.__dict__.copy()
+        c.auto_once = self.auto_once.copy()
+        return c
+
     def triggers(self, event, *args, **kwargs):
         to_remove = [f for f in self.events[event] if f(*args, **kwargs)]
         for f in to_remove:
@@ -132,8 +148,9 @@ class Combatant:
         if self.attack_knack == 'lunge':
             self.auto_once['damage_rolled'] += 1
 
-    def log(self, message, *, indent=4):
-        log(' ' * indent + self.name + ': ' + message)
+    def log(self, message, *args, indent=4):
+        if verbose:
+            log(' ' * indent + self.name + ': ' + message, *args)
 
     def xky(self, roll, keep, reroll, roll_type):
         return xky(roll, keep, reroll)
@@ -168,7 +185,7 @@ class Combatant:
                     break
 
     def disc_bonuses(self, roll_type):
-        all = deepcopy(self.disc[roll_type])
+        all = list(self.disc[roll_type])
         for bonuses in self.multi[roll_type]:
             all.extend(bonuses)
         return all
@@ -177,10 +194,7 @@ class Combatant:
         if not needed:
             return 0
 
-        bonuses = self.disc_bonuses(roll_type)
-        all = [(sum(sub), sub) for sub in all_subsets(bonuses)]
-        enough = [e for e in all if e[0] >= needed]
-        best = min(enough)[1] if enough else []
+        best = best_subset(tuple(self.disc_bonuses(roll_type)), needed)
         self.use_disc_bonuses(roll_type, best)
         return sum(best)
 
@@ -223,7 +237,7 @@ class Combatant:
         roll, keep = self.init_dice
         self.actions = sorted(d10(False) for i in range(roll))[:keep]
         self.init_order = self.actions[:]
-        self.log(f'initiative: {self.actions}', indent=0)
+        self.log('initiative: {}', self.actions, indent=0)
 
     @property
     def damage_dice(self):
@@ -248,7 +262,7 @@ class Combatant:
         roll, keep, serious = self.next_damage(tn, extra_damage)
         self.last_damage_rolled = roll
         light = self.xky(roll, keep, True, 'damage') + self.auto_once_bonus('damage')
-        self.log(f'deals {light} light and {serious} serious wounds')
+        self.log('deals {} light and {} serious wounds', light, serious)
         return light, serious
 
     @property
@@ -259,7 +273,7 @@ class Combatant:
         return roll, keep
 
     def calc_serious(self, light, check):
-        return int(ceil(max(0, light - check) / 10))
+        return int(-(-max(0, light - check) // 10))
 
     def avg_serious(self, light, roll, keep):
         wounds = []
@@ -311,7 +325,7 @@ class Combatant:
             self.light = 0
             self.serious += 1
 
-        self.log(f'{check} wound check ({vps} vp) vs {light_total} light wounds, takes {self.serious - prev_serious} serious')
+        self.log('{} wound check ({} vp) vs {} light wounds, takes {} serious', check, vps, light_total, self.serious - prev_serious)
         self.crippled = self.serious >= self.sw_to_cripple
         self.dead = self.serious >= self.sw_to_kill
 
@@ -349,7 +363,7 @@ class Combatant:
         vps = self.att_vps(self.enemy.tn, roll, keep)
         result = self.xky(roll + vps, keep + vps, not self.crippled, self.attack_knack)
         self.attack_roll = result + self.att_bonus(self.enemy.tn, result)
-        self.log(f'{self.attack_roll} {self.attack_knack} roll ({vps} vp) vs {self.enemy.tn} tn')
+        self.log('{} {} roll ({} vp) vs {} tn', self.attack_roll, self.attack_knack, vps, self.enemy.tn)
 
         success = self.attack_roll >= self.enemy.tn
         if success:
@@ -368,21 +382,22 @@ class Combatant:
         return False
 
     def projected_damage(self, enemy, extra_damage):
-        droll, dkeep, serious = deepcopy(enemy).next_damage(self.tn, extra_damage)
+        droll, dkeep, serious = copy(enemy).next_damage(self.tn, extra_damage)
         light = avg(True, droll, dkeep)
         wcroll, wckeep = self.wc_dice
         return serious + self.avg_serious(light, wcroll, wckeep)[0][1]
 
     def will_parry(self):
-        extra = self.projected_damage(self.enemy, True)
-        base = self.projected_damage(self.enemy, False)
-
         self.interrupt = ''
         if self.predeclare_bonus:
-            parry = True
+            return True
         elif not self.actions or self.actions[0] > self.phase and len(self.actions) < 2:
-            parry = False
-        elif self.actions[0] > self.phase:
+            return False
+
+        extra = self.projected_damage(self.enemy, True)
+        base = self.projected_damage(self.enemy, False)
+
+        if self.actions[0] > self.phase:
             parry = extra + self.serious >= self.sw_to_kill or extra - base >= 2 * self.sw_parry_threshold
             if parry:
                 self.interrupt = 'interrupt '
@@ -427,7 +442,7 @@ class Combatant:
         vps = self.parry_vps(self.enemy.attack_roll, roll, keep)
         result = self.xky(roll + vps, keep + vps, not self.crippled, 'parry')
         self.parry_roll = result + self.parry_bonus(self.enemy.attack_roll, result)
-        self.log(f'{self.parry_roll} {self.interrupt}parry roll ({vps} vp)')
+        self.log('{} {}parry roll ({} vp)', self.parry_roll, self.interrupt, vps)
 
         success = auto_success or self.parry_roll >= self.enemy.attack_roll
         if success:
@@ -1,11 +1,12 @@
 import sys
-from pprint import pprint
-from random import randrange
+import pickle
+from math import comb
+from random import random
 from collections import defaultdict
 
 try:
-    with open('/tmp/probabilities.py') as f:
-        exec(f.read())
+    with open('/tmp/probabilities.pickle', 'rb') as f:
+        prob = pickle.load(f)
 except Exception:
     pass
 else:
@@ -14,15 +15,20 @@ else:
         d.update(prob[reroll])
         prob[reroll] = d
 
+    # (roll, keep) -> average roll, split out of prob once at load time
+    means = {reroll: {key: val for key, val in prob[reroll].items() if len(key) == 2}
+             for reroll in [True, False]}
+
 
 def avg(reroll, roll, keep):
-    return prob[reroll][roll, keep] or (41 + roll + keep)
+    return means[reroll].get((roll, keep)) or (41 + roll + keep)
 
 
 def d10(reroll=True):
-    total = die = randrange(1, 11)
+    # int(random() * 10) is about twice as fast as randrange(10)
+    total = die = int(random() * 10) + 1
     while reroll and die == 10:
-        die = randrange(1, 11)
+        die = int(random() * 10) + 1
         total += die
     return total
 
@@ -44,28 +50,63 @@ def xky(roll, keep, reroll=True):
     return bonus + sum(sorted(d10(reroll) for i in range(roll))[-keep:])
 
 
+def die_pmf(reroll, cap=100):
+    if not reroll:
+        return {v: 0.1 for v in range(1, 11)}
+
+    pmf, p = {}, 1.0
+    for base in range(0, cap, 10):
+        for v in range(1, 10):
+            pmf[base + v] = p / 10
+        p /= 10
+    return pmf
+
+
+def keep_pmf(roll, keep, die):
+    # walk the die faces from highest to lowest, tracking how many dice
+    # have been placed and the sum of the ones kept so far; the weights
+    # are multinomial, so only states with every die placed survive
+    states = {(0, 0): 1.0}
+    for v in sorted(die, reverse=True):
+        q = die[v]
+        next_states = defaultdict(float)
+        for (placed, total), weight in states.items():
+            qc = 1.0
+            for count in range(roll - placed + 1):
+                kept = min(count, max(0, keep - placed))
+                next_states[placed + count, total + v * kept] += weight * comb(roll - placed, count) * qc
+                qc *= q
+        states = {key: w for key, w in next_states.items() if w > 1e-15}
+
+    dist = defaultdict(float)
+    for (placed, total), weight in states.items():
+        if placed == roll:
+            dist[total] += weight
+    return dist
+
+
 if __name__ == "__main__":
-    [fname] = sys.argv[1:2] or ['/tmp/probabilities.py']
-    ROLLS = 1000
-    prob = {True: defaultdict(int), False: defaultdict(int)}
-    for i in range(ROLLS):
+    [fname] = sys.argv[1:2] or ['/tmp/probabilities.pickle']
+    prob = {True: {}, False: {}}
+    for reroll in [True, False]:
+        die = die_pmf(reroll)
         for rolled in range(1, 11):
             for kept in range(1, rolled + 1):
-                for reroll in [True, False]:
-                    result = xky(rolled, kept, reroll)
-                    prob[reroll][rolled, kept] += result
-                    for tn in range(result):
-                        prob[reroll][rolled, kept, tn] += 1
-
-                    if rolled == 10:
-                        for j in range(kept - 1, 1, -1):
-                            prob[reroll][rolled + j, kept - j] += result
-                            for tn in range(result):
-                                prob[reroll][rolled + j, kept - j, tn] += 1
+                dist = keep_pmf(rolled, kept, die)
+                keys = [(rolled, kept)]
+                if rolled == 10:
+                    keys.extend((rolled + j, kept - j) for j in range(kept - 1, 1, -1))
 
-    for reroll in [True, False]:
-        prob[reroll] = {key: val / ROLLS for key, val in prob[reroll].items()}
+                for key in keys:
+                    prob[reroll][key] = sum(total * p for total, p in dist.items())
+
+                over = 1.0
+                for tn in range(max(dist)):
+                    over -= dist[tn]
+                    if over < 1e-6:
+                        break
+                    for key in keys:
+                        prob[reroll][key + (tn,)] = over
 
-    with open(fname, 'w') as f:
-        f.write('prob = ')
-        pprint(prob, stream=f)
+    with open(fname, 'wb') as f:
+        pickle.dump(prob, f)
@@ -28,7 +28,7 @@ class Engine:
         return False, False
 
     def attack(self, knack, attacker, defender):
-        log(f'Phase #{self.phase}: {attacker.name} {knack} vs {defender.name}')
+        log('Phase #{}: {} {} vs {}', self.phase, attacker.name, knack, defender.name)
 
         if defender.will_counterattack(attacker):
             self.attack('counterattack', defender, attacker)
@@ -36,7 +36,7 @@ class AkodoBushi(Combatant):
                 damage += 10
                 self.vps -= 1
             if damage:
-                self.log('spends {} vps to deal {} light wounds'.format(int(ceil(damage / 10)), damage))
+                self.log('spends {} vps to deal {} light wounds', int(ceil(damage / 10)), damage)
                 self.enemy.wound_check(damage)
 
     def choose_action(self):
@@ -51,7 +51,7 @@ class AkodoBushi(Combatant):
     def disc_bonus(self, roll_type, needed):
         bonus = Combatant.disc_bonus(self, roll_type, needed)
         remaining = self.disc_bonuses(roll_type)
-        if len(remaining) > 1 and sum(remaining) >= 30 and roll_type in ['attack', 'double_attack']:
+        if len(remaining) > 1 and sum(remaining) >= 30 and roll_type in {'attack', 'double_attack'}:
             bonus += Combatant.disc_bonus(self, roll_type, sum(remaining) / 2)
         return bonus
 
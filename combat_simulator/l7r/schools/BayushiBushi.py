@@ -1,5 +1,3 @@
-from math import ceil
-
 from l7r.combatant import Combatant
 
 
@@ -21,7 +19,7 @@ class BayushiBushi(Combatant):
         self.events['post_attack'].append(self.reset_damage)
 
     def sa_trigger(self, vps, roll_type):
-        if roll_type in ['feint', 'attack', 'double_attack']:
+        if roll_type in {'feint', 'attack', 'double_attack'}:
             for i in range(vps):
                 self.base_damage_rolled += 1
                 self.base_damage_kept += 1
@@ -61,7 +59,7 @@ class BayushiBushi(Combatant):
 
     def calc_serious(self, light, check):
         if self.rank == 5:
-            return int(ceil(max(0, (light - check) // 2) / 10))
+            return int(-(-max(0, (light - check) // 2) // 10))
 
         return Combatant.calc_serious(self, light, check)
 
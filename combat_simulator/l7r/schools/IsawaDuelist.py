@@ -33,7 +33,7 @@ class IsawaDuelist(Combatant):
 
     def r5t_post(self):
         if self.rank == 5 and self.enemy.light == 0 and self.enemy.serious > self.pre_sw and not self.enemy.dead:
-            self.log(f'sets {self.enemy.name} back to 10 light wounds instead of 0')
+            self.log('sets {} back to 10 light wounds instead of 0', self.enemy.name)
             self.enemy.light = 10
             self.enemy.base_wc_threshold -= 10
 
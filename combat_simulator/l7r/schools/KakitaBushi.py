@@ -38,7 +38,7 @@ class KakitaBushi(Combatant):
         dice = [d10(False) for i in range(roll)]
         self.actions = [(0 if die == 10 else die) for die in dice][:keep]
         self.init_order = self.actions[:]
-        self.log(f'initiative: {self.actions}', indent=0)
+        self.log('initiative: {}', self.actions, indent=0)
 
     def r3t_bonus(self):
         next = self.enemy.actions[0] if self.enemy.actions else 11
@@ -23,13 +23,13 @@ class MatsuBushi(Combatant):
 
     def max_bonus(self, roll_type):
         bonus = Combatant.max_bonus(self, roll_type)
-        if roll_type in ['attack', 'double_attack', 'lunge']:
+        if roll_type in {'attack', 'double_attack', 'lunge'}:
             bonus += 3 * self.attack
         return bonus
 
     def disc_bonus(self, roll_type, needed):
         bonus = Combatant.disc_bonus(self, roll_type, needed)
-        if self.rank >= 3 and bonus < needed and bonus + 3 * self.attack >= needed and roll_type in ['attack', 'double_attack', 'lunge']:
+        if self.rank >= 3 and bonus < needed and bonus + 3 * self.attack >= needed and roll_type in {'attack', 'double_attack', 'lunge'}:
             self.tn -= 5
             self.events['post_defense'].append(self.reset_tn)
             bonus += 3 * self.attack
@@ -40,7 +40,7 @@ class OtakuBushi(Combatant):
 
     def next_damage(self, tn, extra_damage):
         roll, keep, serious = Combatant.next_damage(self, tn, extra_damage)
-        if rank == 5 and self.attack_knack in ['attack', 'lunge']:
+        if rank == 5 and self.attack_knack in {'attack', 'lunge'}:
             serious += 1
             roll = max(2, roll - 10)
         return roll, keep, serious
@@ -15,7 +15,7 @@ class ShibaBushi(Combatant):
     def r3t_trigger(self):
         if self.rank >= 3:
             damage = self.xky(2 * self.attack, 1, True, 'damage')
-            self.log(f'deals {damage} damage with R3T')
+            self.log('deals {} damage with R3T', damage)
             enemy.wound_check(damage, 0)
 
     def r5t_trigger(self):
@@ -33,7 +33,7 @@ class ShinjoBushi(Combatant):
             self.actions.insert(0, 1)
             highest = self.actions.pop()
             self.init_order = self.actions[:]
-            self.log(f'R4T sets highest action die ({highest}) to 1')
+            self.log('R4T sets highest action die ({}) to 1', highest)
 
     def choose_action(self):
         if self.actions: